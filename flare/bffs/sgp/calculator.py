@@ -9,7 +9,7 @@ except Exception as e:
 
 from .sparse_gp import SGP_Wrapper
 import numpy as np
-import time, json
+import os, time, json
 from copy import deepcopy
 
 
@@ -23,6 +23,7 @@ class SGP_Calculator(Calculator):
         self.results = {}
         self.use_mapping = use_mapping
         self.mgp_model = None
+        self._structure_cache = None
 
     # TODO: Figure out why this is called twice per MD step.
     def calculate(self, atoms=None, properties=None, system_changes=all_changes):
@@ -38,10 +39,32 @@ class SGP_Calculator(Calculator):
         if properties is None:
             properties = self.implemented_properties
 
+        structure_descriptor, coded_species = self.get_structure_descriptor(atoms)
+        self.predict_on_structure(structure_descriptor, coded_species)
+
+    def get_structure_descriptor(self, atoms):
+        """
+        Build the structure descriptor of the atoms, or reuse the one of the
+            previous call if neither the atoms nor the model have changed
+            since, e.g. when energy, forces and stress are requested one after
+            another.
+        """
+        key = (
+            atoms.positions,
+            np.asarray(atoms.cell),
+            atoms.numbers,
+            self.gp_model.cutoff,
+        )
+        model = (self.gp_model, self.gp_model.descriptor_calculators)
+        cache = self._structure_cache
+        if cache is not None:
+            same_model = all(a is b for a, b in zip(model, cache["model"]))
+            same_atoms = all(np.array_equal(a, b) for a, b in zip(key, cache["key"]))
+            if same_model and same_atoms:
+                return cache["structure_descriptor"], cache["coded_species"]
+
         # Convert coded species to 0, 1, 2, etc.
-        coded_species = []
-        for spec in atoms.numbers:
-            coded_species.append(self.gp_model.species_map[spec])
+        coded_species = self.gp_model.get_coded_species(atoms.numbers)
 
         # Create structure descriptor.
         structure_descriptor = Structure(
@@ -52,9 +75,15 @@ class SGP_Calculator(Calculator):
             self.gp_model.descriptor_calculators,
         )
 
-        self.predict_on_structure(structure_descriptor)
+        self._structure_cache = {
+            "key": tuple(np.copy(k) for k in key),
+            "model": model,
+            "structure_descriptor": structure_descriptor,
+            "coded_species": coded_species,
+        }
+        return structure_descriptor, coded_species
 
-    def predict_on_structure(self, structure_descriptor):
+    def predict_on_structure(self, structure_descriptor, coded_species=None):
         # Predict on structure.
         if self.gp_model.variance_type == "SOR":
             self.gp_model.sparse_gp.predict_SOR(structure_descriptor)
@@ -64,29 +93,21 @@ class SGP_Calculator(Calculator):
             self.gp_model.sparse_gp.predict_local_uncertainties(structure_descriptor)
 
         # Set results.
-        self.results["energy"] = deepcopy(structure_descriptor.mean_efs[0])
+        self.results["energy"] = float(structure_descriptor.mean_efs[0])
         self.results["forces"] = deepcopy(
             structure_descriptor.mean_efs[1:-6].reshape(-1, 3)
         )
 
-        # Add back single atom energies
+        # Add back single atom energies. Reuse the coded species of the
+        # caller if given, to avoid copying them back from the descriptor.
         if self.gp_model.single_atom_energies is not None:
-            for spec in structure_descriptor.species:
-                self.results["energy"] += self.gp_model.single_atom_energies[spec]
+            if coded_species is None:
+                coded_species = structure_descriptor.species
+            self.results["energy"] += self.gp_model.get_single_atom_sum(coded_species)
 
         # Convert stress to ASE format.
-        flare_stress = deepcopy(structure_descriptor.mean_efs[-6:])
-        ase_stress = -np.array(
-            [
-                flare_stress[0],
-                flare_stress[3],
-                flare_stress[5],
-                flare_stress[4],
-                flare_stress[2],
-                flare_stress[1],
-            ]
-        )
-        self.results["stress"] = ase_stress
+        flare_stress = structure_descriptor.mean_efs[-6:]
+        self.results["stress"] = -flare_stress[[0, 3, 5, 4, 2, 1]]
 
         # Report negative variances, which can arise if there are numerical
         # instabilities.
@@ -94,31 +115,18 @@ class SGP_Calculator(Calculator):
             self.gp_model.variance_type == "DTC"
         ):
             variances = structure_descriptor.variance_efs[1:-6]
-            stds = np.zeros(len(variances))
-            for n in range(len(variances)):
-                var = variances[n]
-                if var > 0:
-                    stds[n] = np.sqrt(var)
-                else:
-                    stds[n] = -np.sqrt(np.abs(var))
-            self.results["stds"] = stds.reshape(-1, 3)
+            self.results["stds"] = signed_sqrt(variances).reshape(-1, 3)
         # The "local" variance type should be used only if the model has a
         # single atom-centered descriptor.
         # TODO: Generalize this variance type to multiple descriptors.
         elif self.gp_model.variance_type == "local":
             variances = structure_descriptor.local_uncertainties[0]
             sorted_variances = sort_variances(structure_descriptor, variances)
-            stds = np.zeros(len(sorted_variances))
-            for n in range(len(sorted_variances)):
-                var = sorted_variances[n]
-                if var > 0:
-                    stds[n] = np.sqrt(var)
-                else:
-                    stds[n] = -np.sqrt(np.abs(var))
             stds_full = np.zeros((len(sorted_variances), 3))
+            stds = signed_sqrt(sorted_variances, out=stds_full[:, 0])
 
             # Divide by the signal std to get a unitless value.
-            stds_full[:, 0] = stds / np.abs(self.gp_model.hyps[0])
+            stds /= np.abs(self.gp_model.signal_std)
             self.results["stds"] = stds_full
 
     def get_uncertainties(self, atoms):
@@ -138,6 +146,7 @@ class SGP_Calculator(Calculator):
         out_dict["class"] = self.__class__.__name__
         out_dict["gp_model"] = self.gp_model.as_dict()
         out_dict.pop("atoms")
+        out_dict.pop("_structure_cache", None)
 
         if "get_spin_polarized" in out_dict:
             out_dict.pop("get_spin_polarized")
@@ -170,21 +179,45 @@ class SGP_Calculator(Calculator):
         self, filename="lmp.flare", contributor="user", map_uncertainty=False
     ):
         # write potential file for lammps
-        self.gp_model.sparse_gp.write_mapping_coefficients(filename, contributor, 0)
+        sparse_gp = self.gp_model.sparse_gp
+        replace_file(sparse_gp.write_mapping_coefficients, filename, contributor, 0)
 
         # write uncertainty file(s)
         if map_uncertainty:
-            self.gp_model.write_varmap_coefficients(
-                f"map_unc_{filename}", contributor, 0
+            replace_file(
+                self.gp_model.write_varmap_coefficients,
+                f"map_unc_{filename}",
+                contributor,
+                0,
             )
         else:
             # write L_inv and sparse descriptors for variance in lammps
-            self.gp_model.sparse_gp.write_L_inverse(f"L_inv_{filename}", contributor)
-            self.gp_model.sparse_gp.write_sparse_descriptors(
-                f"sparse_desc_{filename}", contributor
+            replace_file(sparse_gp.write_L_inverse, f"L_inv_{filename}", contributor)
+            replace_file(
+                sparse_gp.write_sparse_descriptors,
+                f"sparse_desc_{filename}",
+                contributor,
             )
 
 
+def replace_file(write_func, filename, *args):
+    """Call `write_func(tmp_name, *args)` to write a temporary file, then
+    move it to `filename`, so that a partially written file is never left
+    in place of the previous one."""
+    tmp_name = f"{filename}.tmp"
+    write_func(tmp_name, *args)
+    os.replace(tmp_name, filename)
+
+
+def signed_sqrt(variances, out=None):
+    """Square root of the magnitude of the variances, keeping the sign of
+    negative variances, which can arise from numerical instabilities. The
+    result is computed in place in `out` if it is given."""
+    stds = np.abs(variances, out=out)
+    np.sqrt(stds, out=stds)
+    return np.copysign(stds, variances, out=stds)
+
+
 def sort_variances(structure_descriptor, variances):
     # Check that the variance length matches the number of atoms.
     assert len(variances) == structure_descriptor.noa
@@ -5,6 +5,7 @@ from scipy.optimize import minimize
 from typing import List
 import warnings
 from ase import Atoms
+from ase.data import chemical_symbols
 from flare.atoms import FLARE_Atoms
 from flare.utils import NumpyEncoder
 
@@ -52,6 +53,12 @@ class SGP_Wrapper:
         self.bounds = bounds
         self.atom_indices = []
         self.rel_efs_noise = []
+        self._signal_std = None
+
+        # Lookup table from atomic number to coded species, -1 if unmapped.
+        self._species_lookup = np.full(len(chemical_symbols), -1, dtype=np.int32)
+        for number, coded_spec in species_map.items():
+            self._species_lookup[number] = coded_spec
 
         # Make placeholder hyperparameter labels.
         self.hyp_labels = []
@@ -82,6 +89,19 @@ class SGP_Wrapper:
     def hyps(self):
         return self.sparse_gp.hyperparameters
 
+    @property
+    def signal_std(self):
+        """Signal std of the first kernel. It is cached to avoid copying the
+        hyperparameters from C++ on every prediction, so the hyperparameters
+        should only be changed through set_hyperparameters or train."""
+        if self._signal_std is None:
+            self._signal_std = self.sparse_gp.hyperparameters[0]
+        return self._signal_std
+
+    def set_hyperparameters(self, hyps):
+        self._signal_std = None
+        self.sparse_gp.set_hyperparameters(hyps)
+
     @property
     def hyps_and_labels(self):
         return self.hyps, self.hyp_labels
@@ -119,6 +139,30 @@ class SGP_Wrapper:
     def check_L_alpha(self):
         pass
 
+    def get_coded_species(self, numbers):
+        """Convert atomic numbers to coded species 0, 1, 2, etc."""
+        coded_species = self._species_lookup[numbers]
+        if np.any(coded_species < 0):
+            missing = set(np.asarray(numbers)[coded_species < 0].tolist())
+            raise KeyError(f"Species {missing} not found in species_map")
+        return coded_species
+
+    def get_single_atom_sum(self, coded_species):
+        """Sum of the single atom energies of a list of coded species."""
+        if self.single_atom_energies is None:
+            return 0.0
+
+        # Count the atoms of each species, so the sum loops over species
+        # rather than atoms.
+        counts = np.bincount(coded_species, minlength=len(self.species_map))
+        return float(
+            sum(
+                count * self.single_atom_energies[spec]
+                for spec, count in enumerate(counts)
+                if count > 0
+            )
+        )
+
     def write_model(self, name: str):
         """
         Write to .json file
@@ -136,7 +180,13 @@ class SGP_Wrapper:
     def as_dict(self):
         out_dict = {}
         for key in vars(self):
-            if key not in ["sparse_gp", "sgp_var", "descriptor_calculators"]:
+            if key not in [
+                "sparse_gp",
+                "sgp_var",
+                "descriptor_calculators",
+                "_species_lookup",
+                "_signal_std",
+            ]:
                 out_dict[key] = getattr(self, key, None)
 
         # save descriptor_settings
@@ -180,13 +230,14 @@ class SGP_Wrapper:
                     raise NotImplementedError
             out_dict["sgp_var_kernels"] = kernel_list
 
+        # invert mapping of species
+        inv_species_map = {v: k for k, v in self.species_map.items()}
+
         out_dict["training_structures"] = []
         for s in range(len(self.training_data)):
             custom_range = self.sparse_gp.sparse_indices[0][s]
             struc_cpp = self.training_data[s]
 
-            # invert mapping of species
-            inv_species_map = {v: k for k, v in self.species_map.items()}
             species = [inv_species_map[s] for s in struc_cpp.species]
 
             # build training structure
@@ -200,11 +251,7 @@ class SGP_Wrapper:
             train_struc.info["rel_efs_noise"] = np.array(self.rel_efs_noise[s])
 
             # Add back the single atom energies to dump the original energy
-            single_atom_sum = 0
-            if self.single_atom_energies is not None:
-                for spec in struc_cpp.species:
-                    single_atom_sum += self.single_atom_energies[spec]
-
+            single_atom_sum = self.get_single_atom_sum(struc_cpp.species)
             train_struc.energy = struc_cpp.energy + single_atom_sum
 
             out_dict["training_structures"].append(train_struc.as_dict())
@@ -330,9 +377,7 @@ class SGP_Wrapper:
 
         # Convert coded species to 0, 1, 2, etc.
         if isinstance(structure, (Atoms, FLARE_Atoms)):
-            coded_species = []
-            for spec in structure.numbers:
-                coded_species.append(self.species_map[spec])
+            coded_species = self.get_coded_species(structure.numbers)
         elif isinstance(structure, Structure):
             coded_species = structure.species
         else:
@@ -350,10 +395,7 @@ class SGP_Wrapper:
         # Add labels to structure descriptor.
         if (energy is not None) and (self.energy_training):
             # Sum up single atom energies.
-            single_atom_sum = 0
-            if self.single_atom_energies is not None:
-                for spec in coded_species:
-                    single_atom_sum += self.single_atom_energies[spec]
+            single_atom_sum = self.get_single_atom_sum(coded_species)
 
             # Correct the energy label and assign to structure.
             corrected_energy = energy - single_atom_sum
@@ -413,12 +455,17 @@ class SGP_Wrapper:
         pass
 
     def train(self, logger_name=None):
-        optimize_hyperparameters(
-            self.sparse_gp,
-            max_iterations=self.max_iterations,
-            method=self.opt_method,
-            bounds=self.bounds,
-        )
+        # The optimizer sets the hyperparameters at every step, so clear the
+        # cached signal std even if it fails part way.
+        try:
+            optimize_hyperparameters(
+                self.sparse_gp,
+                max_iterations=self.max_iterations,
+                method=self.opt_method,
+                bounds=self.bounds,
+            )
+        finally:
+            self._signal_std = None
 
     def write_mapping_coefficients(self, filename, contributor, kernel_idx):
         self.sparse_gp.write_mapping_coefficients(filename, contributor, kernel_idx)
@@ -414,21 +414,21 @@ class Output:
         time_curr = time.time() - start_time
         f = logging.getLogger(self.basename + "log")
         if task is None:
-            f.info(f"Wall time from start: {time_curr:.2f} s")
+            f.info("Wall time from start: %.2f s", time_curr)
         else:
-            f.info(f"Time of {task}: {time_curr:.2f} s")
+            f.info("Time of %s: %.2f s", task, time_curr)
 
     def conclude_dft(self, dft_count, start_time):
         f = logging.getLogger(self.basename + "log")
         f.info("DFT run complete.")
-        f.info(f"Number of DFT calls: {dft_count}")
+        f.info("Number of DFT calls: %s", dft_count)
         self.write_wall_time(start_time)
 
     def add_atom_info(self, train_atoms, stds):
         f = logging.getLogger(self.basename + "log")
-        f.info(f"Adding atom {train_atoms} to the training set.")
+        f.info("Adding atom %s to the training set.", train_atoms)
         if len(train_atoms) > 0:
-            f.info(f"Uncertainty: {stds[train_atoms[0]]}")
+            f.info("Uncertainty: %s", stds[train_atoms[0]])
 
     def write_gp_dft_comparison(
         self,
@@ -660,36 +660,38 @@ def compute_mae(
         if dft_energy is not None and gp_energy is not None:
             e_mae = np.mean(np.abs(dft_energy - gp_energy))
             e_mav = np.mean(np.abs(dft_energy))
-            f.info(f"energy mae: {e_mae:.4f} eV")
-            f.info(f"energy mav: {e_mav:.4f} eV")
+            f.info("energy mae: %.4f eV", e_mae)
+            f.info("energy mav: %.4f eV", e_mav)
 
         if dft_stress is not None and gp_stress is not None:
             s_mae = np.mean(np.abs(dft_stress - gp_stress))
             s_mav = np.mean(np.abs(dft_stress))
-            f.info(f"stress mae: {s_mae:.4f} eV/A^3")
-            f.info(f"stress mav: {s_mav:.4f} eV/A^3")
+            f.info("stress mae: %.4f eV/A^3", s_mae)
+            f.info("stress mav: %.4f eV/A^3", s_mav)
 
-    f_mae = np.mean(np.abs(dft_forces - gp_forces))
-    f_mav = np.mean(np.abs(dft_forces))
-    f.info(f"forces mae: {f_mae:.4f} eV/A")
-    f.info(f"forces mav: {f_mav:.4f} eV/A")
+    # compute the force errors once and reuse them for the per-species MAE
+    force_errors = np.abs(dft_forces - gp_forces)
+    force_values = np.abs(dft_forces)
+    f_mae = np.mean(force_errors)
+    f_mav = np.mean(force_values)
+    f.info("forces mae: %.4f eV/A", f_mae)
+    f.info("forces mav: %.4f eV/A", f_mav)
 
     # compute the per-species MAE
-    unique_species = list(set(atoms.numbers))
-    per_species_mae = np.zeros(len(unique_species))
-    per_species_mav = np.zeros(len(unique_species))
-    per_species_num = np.zeros(len(unique_species))
-    for a in range(atoms.nat):
-        species_ind = unique_species.index(atoms.numbers[a])
-        per_species_mae[species_ind] += np.mean(np.abs(dft_forces[a] - gp_forces[a]))
-        per_species_mav[species_ind] += np.mean(np.abs(dft_forces[a]))
-        per_species_num[species_ind] += 1
-    per_species_mae /= per_species_num
-    per_species_mav /= per_species_num
+    unique_species, species_ind = np.unique(atoms.numbers, return_inverse=True)
+    per_species_num = np.bincount(species_ind)
+    per_species_mae = (
+        np.bincount(species_ind, weights=np.mean(force_errors, axis=1))
+        / per_species_num
+    )
+    per_species_mav = (
+        np.bincount(species_ind, weights=np.mean(force_values, axis=1))
+        / per_species_num
+    )
 
     for s in range(len(unique_species)):
         curr_species = unique_species[s]
-        f.info(f"type {curr_species} forces mae: {per_species_mae[s]:.4f} eV/A")
-        f.info(f"type {curr_species} forces mav: {per_species_mav[s]:.4f} eV/A")
+        f.info("type %d forces mae: %.4f eV/A", curr_species, per_species_mae[s])
+        f.info("type %d forces mav: %.4f eV/A", curr_species, per_species_mav[s])
 
     return e_mae, e_mav, f_mae, f_mav, s_mae, s_mav
@@ -116,6 +116,11 @@ class OTF:
             `FakeMD` and `FakeDFT`. Each frame needs to have a global
             property called "target_atoms" specifying a list of atomic
             environments added to the GP model.
+        wandb_log (str, optional): Name of the wandb project to log to. If
+            None, wandb is not used. Defaults to None.
+        wandb_log_every (int, optional): Minimum number of MD steps between
+            wandb logs of the temperature, energies and uncertainties. The
+            state is always logged on DFT steps. Defaults to 1.
     """
 
     def __init__(
@@ -152,6 +157,7 @@ class OTF:
         # other args
         build_mode="bayesian",
         wandb_log=None,
+        wandb_log_every: int = 1,
         **kwargs,
     ):
 
@@ -289,6 +295,10 @@ class OTF:
 
         # wandb
         self.wandb_log = wandb_log
+        if wandb_log_every < 1:
+            raise ValueError("wandb_log_every should be a positive integer")
+        self.wandb_log_every = wandb_log_every
+        self._last_wandb_step = None
         if wandb_log is not None:
             wandb.init(project=wandb_log)
 
@@ -539,7 +549,6 @@ class OTF:
                 tol = -self.std_tolerance
             else:
                 tol = np.abs(self.gp.force_noise) * self.std_tolerance
-            f = logging.getLogger(self.output.basename + "log")
             self.md.step(tol, self.number_of_steps)
             self.curr_step = self.md.nsteps
             self.atoms = FLARE_Atoms.from_ase_atoms(self.md.curr_atoms)
@@ -645,16 +654,7 @@ class OTF:
         # (xx, xy, xz, yy, yz, zz).
         flare_stress = None
         if dft_stress is not None:
-            flare_stress = -np.array(
-                [
-                    dft_stress[0],
-                    dft_stress[5],
-                    dft_stress[4],
-                    dft_stress[1],
-                    dft_stress[3],
-                    dft_stress[2],
-                ]
-            )
+            flare_stress = -np.asarray(dft_stress)[[0, 5, 4, 1, 3, 2]]
 
         if self.force_only:
             dft_energy = None
@@ -783,23 +783,21 @@ class OTF:
         )
         self.output.write_wall_time(tic, task="Write Config")
 
-        # wandb log mae
-        if self.wandb_log is not None:
-            wandb.log(
-                {
-                    "temperature": self.temperature,
-                    "ke": self.KE,
-                    "pe": self.atoms.get_potential_energy(),
-                },
-                step = self.curr_step,
-            )
+        # wandb log md state
+        if (self.wandb_log is not None) and (
+            self.dft_step
+            or (self._last_wandb_step is None)
+            or (self.curr_step - self._last_wandb_step >= self.wandb_log_every)
+        ):
+            self._last_wandb_step = self.curr_step
+            md_state = {
+                "temperature": self.temperature,
+                "ke": self.KE,
+                "pe": self.atoms.get_potential_energy(),
+            }
             if "stds" in self.atoms.calc.results:
-                wandb.log(
-                    {
-                        "maxunc": np.max(np.abs(self.atoms.calc.results["stds"])),
-                    },
-                    step = self.curr_step,
-                )
+                md_state["maxunc"] = np.max(np.abs(self.atoms.calc.results["stds"]))
+            wandb.log(md_state, step = self.curr_step)
 
         if self.md_engine == "Fake" and not self.dft_step:
             tic = time.time()
@@ -55,26 +55,20 @@ def is_std_in_bound(
     else:
         threshold = np.abs(std_tolerance)
 
-    # sort max stds
-    nat = len(structure)
-    max_stds = np.zeros((nat))
-    for atom, std in enumerate(structure.stds):
-        max_stds[atom] = np.max(std)
-    stds_sorted = np.argsort(max_stds)
+    # max std component of each atom
+    max_stds = np.max(structure.stds, axis=1)
+
+    # skip sorting if no atom is above threshold
+    if not max_stds.max() > threshold:
+        return True, [-1]
 
+    stds_sorted = np.argsort(max_stds)
     if update_style == "add_n":
         target_atoms = list(stds_sorted[-max_atoms_added:])
     elif update_style == "threshold":
-        target_atoms = []
-        for atom_index in stds_sorted:
-            if max_stds[atom_index] > update_threshold:
-                target_atoms.append(atom_index)
+        target_atoms = list(stds_sorted[max_stds[stds_sorted] > update_threshold])
 
-    # if above threshold, return atom
-    if max_stds[stds_sorted[-1]] > threshold:
-        return False, target_atoms
-    else:
-        return True, [-1]
+    return False, target_atoms
 
 
 def is_std_in_bound_per_species(
@@ -130,7 +124,7 @@ def is_std_in_bound_per_species(
 
     # Determine if any std component will trigger the threshold
     # before looking through individual species.
-    max_std_components = [np.nanmax(std) for std in structure.stds]
+    max_std_components = np.nanmax(structure.stds, axis=1)
     if np.nanmax(max_std_components) < threshold:
         return True, [-1]
 
@@ -198,6 +198,7 @@ class LAMMPS_MD(MolecularDynamics):
 
         super().__init__(atoms, timestep, trajectory)  # , **kwargs)
         self.curr_atoms = self.atoms.copy()
+        self.n_traj_frames = None
 
     def step(self, std_tolerance, N_steps):
         """
@@ -281,9 +282,8 @@ class LAMMPS_MD(MolecularDynamics):
         assert np.allclose(trj[-1].get_volume(), lmp_calc.atoms.get_volume())
         pos1 = trj[-1].get_positions(wrap=True)
         pos2 = lmp_calc.atoms.get_positions(wrap=True)
-        pos_diff = (pos1 - pos2) @ np.linalg.inv(lmp_calc.atoms.cell)
-        for i in np.reshape(pos_diff.round(6), -1):
-            assert i.is_integer()
+        pos_diff = ((pos1 - pos2) @ np.linalg.inv(lmp_calc.atoms.cell)).round(6)
+        assert np.all(pos_diff == np.rint(pos_diff))
 
         # Back up the trajectory into the .xyz file
         self.backup(trj)
@@ -305,14 +305,18 @@ class LAMMPS_MD(MolecularDynamics):
         with open(self.thermo_file) as f:
             n_iters = f.read().count("#")
 
-        if self.traj_xyz_file in os.listdir():
-            previous_trj = read(self.traj_xyz_file, index=":")
-            assert (
-                thermostat.shape[0]
-                == 2 * (len(previous_trj) + len(curr_trj)) - 2 * n_iters
-            )
-        else:
-            assert thermostat.shape[0] == 2 * len(curr_trj) - 2 * n_iters
+        # Count the frames backed up so far. The .xyz file is only read if
+        # it exists before the first backup, e.g. when restarting a run.
+        if self.n_traj_frames is None:
+            if os.path.isfile(self.traj_xyz_file):
+                self.n_traj_frames = len(read(self.traj_xyz_file, index=":"))
+            else:
+                self.n_traj_frames = 0
+
+        assert (
+            thermostat.shape[0]
+            == 2 * (self.n_traj_frames + len(curr_trj)) - 2 * n_iters
+        )
 
         # Extract energy, stress and step from dumped log file and write to
         # the frames in .xyz
@@ -328,6 +332,7 @@ class LAMMPS_MD(MolecularDynamics):
             )
 
         write(self.traj_xyz_file, curr_trj, append=True, format="extxyz")
+        self.n_traj_frames += len(curr_trj)
 
     def todict(self):
         dct = super().todict()
@@ -365,7 +370,7 @@ def get_kinetic_stress(atoms):
     velocities = atoms.get_velocities()
     masses = atoms.get_masses()
     volume = atoms.get_volume()
-    kinetic = velocities.T @ np.diag(masses) @ velocities / volume
+    kinetic = (velocities.T * masses) @ velocities / volume
 
     # apply the Lammps rotation stuff to the stress (copied from lammpsrun.py)
     prism = Prism(atoms.get_cell())
@@ -488,7 +493,7 @@ def check_sgp_match(atoms, sgp_calc, logger, specorder, command):
             lmp_stds[:, 0],
             gp_stds[:, 0],
         )
-    except:
+    except (AssertionError, ValueError):
         # if the trajectory does not match sgp, this is probably because
         # 1. the dumped atomic positions in LAMMPS lose precision, or
         # 2. some groups of atoms have forces zeroed out, e.g. frozen a slab bottom.
@@ -534,7 +539,7 @@ def check_sgp_match(atoms, sgp_calc, logger, specorder, command):
     du = np.max(np.abs(lmp_stds[:, 0] - gp_stds[:, 0]))
 
     logger.info("LAMMPS and SGP maximal absolute difference in prediction:")
-    logger.info(f"Maximal absolute energy difference: {de}")
-    logger.info(f"Maximal absolute forces difference: {df}")
-    logger.info(f"Maximal absolute stress difference: {ds}")
-    logger.info(f"Maximal absolute uncertainty difference: {du}")
+    logger.info("Maximal absolute energy difference: %s", de)
+    logger.info("Maximal absolute forces difference: %s", df)
+    logger.info("Maximal absolute stress difference: %s", ds)
+    logger.info("Maximal absolute uncertainty difference: %s", du)
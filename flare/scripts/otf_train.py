@@ -285,10 +285,14 @@ def get_sgp_calc(flare_config):
     species_map = {flare_config.get("species")[i]: i for i in range(n_species)}
     sae_dct = flare_config.get("single_atom_energies", None)
     if sae_dct is not None:
+        # A single value is used for all the species.
+        sae_dct = np.atleast_1d(np.asarray(sae_dct, dtype=np.float64))
+        if len(sae_dct) == 1:
+            sae_dct = np.full(n_species, sae_dct[0])
         assert n_species == len(
             sae_dct
         ), "'single_atom_energies' should be the same length as 'species'"
-        single_atom_energies = {i: sae_dct[i] for i in range(n_species)}
+        single_atom_energies = {i: float(sae_dct[i]) for i in range(n_species)}
     else:
         single_atom_energies = {i: 0 for i in range(n_species)}
 
@@ -58,6 +58,30 @@ def test_train(multicut):
     assert sgp.likelihood != 0.0
 
 
+@pytest.mark.parametrize("multicut", multiple_cutoff)
+def test_signal_std(multicut):
+    """Check that the uncertainties follow changes of the hyperparameters
+    made after a prediction."""
+
+    atoms = get_random_atoms()
+    sgp_calc = get_sgp_calc(multiple_cutoff=multicut)
+    sgp = sgp_calc.gp_model
+    sgp_calc.get_uncertainties(atoms)
+
+    hyps = np.array(sgp.hyps)
+    hyps[0] *= 2
+    sgp.set_hyperparameters(hyps)
+    stds = sgp_calc.get_uncertainties(atoms)
+    assert sgp.signal_std == sgp.hyps[0]
+
+    new_sgp, _ = SGP_Wrapper.from_dict(sgp.as_dict())
+    assert np.allclose(stds, SGP_Calculator(new_sgp).get_uncertainties(atoms))
+
+    sgp.train()
+    sgp_calc.get_uncertainties(atoms)
+    assert sgp.signal_std == sgp.hyps[0]
+
+
 @pytest.mark.parametrize("multicut", multiple_cutoff)
 def test_dict(multicut):
     """
@@ -102,6 +126,50 @@ def test_calc(multicut):
     assert len(calc.gp_model) == len(new_calc.gp_model)
 
 
+@pytest.mark.parametrize("multicut", multiple_cutoff)
+def test_structure_cache(multicut):
+    """Check that the structure descriptor is reused only while the atoms
+    and the model are unchanged."""
+
+    atoms = get_random_atoms()
+    sgp_calc = get_sgp_calc(multiple_cutoff=multicut)
+    atoms.calc = sgp_calc
+
+    forces = atoms.get_forces()
+    structure_descriptor, _ = sgp_calc.get_structure_descriptor(atoms)
+    atoms.get_stress()
+    assert sgp_calc.get_structure_descriptor(atoms)[0] is structure_descriptor
+    assert np.allclose(atoms.get_forces(), forces)
+
+    # The cached descriptor predicts the same as a freshly built one.
+    new_calc = SGP_Calculator(sgp_calc.gp_model)
+    new_calc.calculate(atoms)
+    for prop in ["energy", "forces", "stress", "stds"]:
+        assert np.allclose(sgp_calc.results[prop], new_calc.results[prop])
+
+    atoms.positions[0] += 0.01
+    forces = atoms.get_forces()
+    assert sgp_calc.get_structure_descriptor(atoms)[0] is not structure_descriptor
+    structure_descriptor, _ = sgp_calc.get_structure_descriptor(atoms)
+
+    # Predictions on the same atoms follow updates of the model.
+    training_structure = get_random_atoms()
+    training_structure.calc = LennardJones()
+    sgp_calc.gp_model.update_db(
+        training_structure,
+        training_structure.get_forces(),
+        custom_range=[1, 2, 3],
+        energy=training_structure.get_potential_energy(),
+        stress=training_structure.get_stress(),
+        mode="specific",
+    )
+    assert not np.allclose(atoms.get_forces(), forces)
+
+    # Swapping the model invalidates the cached descriptor.
+    sgp_calc.gp_model = get_updated_sgp(multiple_cutoff=multicut)
+    assert sgp_calc.get_structure_descriptor(atoms)[0] is not structure_descriptor
+
+
 @pytest.mark.parametrize("multicut", multiple_cutoff)
 def test_write_model(multicut):
     """Test that a reconstructed SGP calculator predicts the same forces
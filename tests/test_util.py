@@ -5,6 +5,7 @@ from pytest import raises
 
 from flare.atoms import FLARE_Atoms
 from flare.learners.utils import (
+    is_std_in_bound,
     is_std_in_bound_per_species,
     is_force_in_bound_per_species,
     subset_of_frame_by_element,
@@ -13,6 +14,32 @@ from flare.learners.utils import (
 from tests.test_gp import get_random_structure
 
 
+def test_std_in_bound():
+    test_structure, _ = get_random_structure(np.eye(3), ["H", "O"], 3)
+    test_structure.stds = np.array([[1, 0, 0], [2, 0, 0], [3, 0, 0]])
+    # Test that 'test mode' works
+    result, target_atoms = is_std_in_bound(0, 1, test_structure)
+    assert result is True and target_atoms == [-1]
+    # Test that high rel tolerance works
+    result, target_atoms = is_std_in_bound(1, 4, test_structure, max_atoms_added=1)
+    assert result is True and target_atoms == [-1]
+    # Test that high abs tolerance works
+    result, target_atoms = is_std_in_bound(-4, 0, test_structure, max_atoms_added=1)
+    assert result is True and target_atoms == [-1]
+    # Test that the max atoms added works
+    result, target_atoms = is_std_in_bound(1, 2.9, test_structure, max_atoms_added=2)
+    assert result is False and target_atoms == [1, 2]
+    # Test that the threshold update style works
+    result, target_atoms = is_std_in_bound(
+        -2.9,
+        0,
+        test_structure,
+        update_style="threshold",
+        update_threshold=1.5,
+    )
+    assert result is False and target_atoms == [1, 2]
+
+
 def test_std_in_bound_per_species():
     test_structure, _ = get_random_structure(np.eye(3), ["H", "O"], 3)
     test_structure.symbols = ["H", "H", "O"]